@@ -1,14 +1,16 @@
 """Add command for indexing files into memory store."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 
-from ram.indexing.indexer import FileIndexer
-from ram.storage.manager import StorageManager
 from ram.storage.scope import StorageScope
 
+if TYPE_CHECKING:
+    from ram.storage.store import MemoryStore
+
 console = Console()
 
 
@@ -22,6 +24,12 @@ def add(ctx: typer.Context, file_path: str) -> None:
         ctx: Typer context with scope flags from parent
         file_path: Path to the file to index
     """
+    # Heavy imports (torch, sentence-transformers, lancedb) are deferred so
+    # other commands and --version start quickly
+    from ram.indexing.indexer import FileIndexer
+    from ram.indexing.reader import read_file
+    from ram.storage.manager import StorageManager
+
     # Convert to Path object
     path = Path(file_path)
 
@@ -36,26 +44,9 @@ def add(ctx: typer.Context, file_path: str) -> None:
         console.print(f"[red]✗[/red] Error: '{file_path}' is not a file")
         raise typer.Exit(1)
 
-    # Try to read as UTF-8
-    try:
-        content = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        console.print(
-            f"[red]✗[/red] Error: File '{file_path}' is not UTF-8 encoded"
-        )
-        console.print(
-            "\nThis command only supports text files. Convert to UTF-8 or use a different tool."
-        )
-        raise typer.Exit(1)
-    except PermissionError:
-        console.print(
-            f"[red]✗[/red] Error: Permission denied reading '{path.absolute()}'"
-        )
-        console.print("\nCheck file permissions and try again.")
-        raise typer.Exit(1)
-
-    # Check file size (10MB limit)
-    file_size_mb = len(content.encode("utf-8")) / 1024 / 1024
+    # Check file size (10MB limit) from metadata, before reading anything
+    stat = path.stat()
+    file_size_mb = stat.st_size / 1024 / 1024
     if file_size_mb > 10:
         console.print(
             f"[red]✗[/red] Error: File '{file_path}' is too large ({file_size_mb:.1f} MB)"
@@ -88,21 +79,34 @@ def add(ctx: typer.Context, file_path: str) -> None:
         console.print(f"[red]✗[/red] Error: {e}")
         raise typer.Exit(1)
 
-    # Check for duplicates
-    import hashlib
-
-    file_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    # Unchanged files reuse their recorded hash, so the duplicate check
+    # can run without reading or hashing the file
+    cached_hash = store.fast_check(path, stat)
+    if cached_hash is not None:
+        _confirm_reindex(store, cached_hash)
 
-    if store.check_file_exists(file_hash):
-        console.print(f"File already indexed (hash: {file_hash[:12]}...)")
-        console.print(f"Previously indexed")
-        console.print()
+    # Read once (memory-mapped for large files), validating UTF-8 and hashing
+    # unless the file still matches the stat its cached hash was found with
+    try:
+        content, file_hash, read_stat = read_file(path, cached_hash, stat)
+    except UnicodeDecodeError:
+        console.print(
+            f"[red]✗[/red] Error: File '{file_path}' is not UTF-8 encoded"
+        )
+        console.print(
+            "\nThis command only supports text files. Convert to UTF-8 or use a different tool."
+        )
+        raise typer.Exit(1)
+    except PermissionError:
+        console.print(
+            f"[red]✗[/red] Error: Permission denied reading '{path.absolute()}'"
+        )
+        console.print("\nCheck file permissions and try again.")
+        raise typer.Exit(1)
 
-        # Ask user if they want to re-index
-        response = typer.confirm("Re-index? This will add duplicate chunks.")
-        if not response:
-            console.print("Skipped indexing.")
-            raise typer.Exit(0)
+    # Check for duplicates
+    if file_hash != cached_hash:
+        _confirm_reindex(store, file_hash)
 
     # Show progress for large files
     show_progress = file_size_mb > 1.0
@@ -112,12 +116,14 @@ def add(ctx: typer.Context, file_path: str) -> None:
     indexer = FileIndexer()
 
     try:
-        index_entries = indexer.process_file(path, show_progress=show_progress)
+        index_entries = indexer.process_text(
+            path, content, file_hash, show_progress=show_progress
+        )
     except Exception as e:
         console.print(f"\n[red]✗[/red] Error during processing: {e}")
         raise typer.Exit(1)
 
-    chunk_count = len(index_entries)
+    chunk_count = index_entries.num_rows
     console.print(f"{chunk_count} chunks created")
 
     if show_progress:
@@ -127,7 +133,9 @@ def add(ctx: typer.Context, file_path: str) -> None:
     console.print("Storing chunks... ", end="")
 
     try:
-        store.add_chunks(index_entries)
+        store.add_chunks_arrow(index_entries)
+        store.close()
+        store.record_file(path, file_hash, read_stat)
         console.print("done")
     except Exception as e:
         console.print(f"\n[red]✗[/red] Error storing chunks: {e}")
@@ -145,3 +153,27 @@ def add(ctx: typer.Context, file_path: str) -> None:
     console.print()
 
     console.print("Next: Search with 'ram search \"query text\"'")
+
+
+def _confirm_reindex(store: "MemoryStore", file_hash: str) -> None:
+    """Ask before re-indexing a file whose hash is already in the store.
+
+    Args:
+        store: Memory store being written to
+        file_hash: SHA256 hash of the file content
+
+    Raises:
+        typer.Exit: If the user declines to re-index
+    """
+    if not store.check_file_exists(file_hash):
+        return
+
+    console.print(f"File already indexed (hash: {file_hash[:12]}...)")
+    console.print(f"Previously indexed")
+    console.print()
+
+    # Ask user if they want to re-index
+    response = typer.confirm("Re-index? This will add duplicate chunks.")
+    if not response:
+        console.print("Skipped indexing.")
+        raise typer.Exit(0)
@@ -6,9 +6,7 @@ import typer
 from rich.console import Console
 
 from ram.storage.config import Config
-from ram.storage.context import ProjectContext
 from ram.storage.scope import StorageScope
-from ram.storage.store import MemoryStore
 
 console = Console()
 
@@ -48,9 +46,14 @@ def init(ctx: typer.Context) -> None:
         raise typer.Exit(0)
 
     # Create and initialize the store
+    from ram.storage.store import MemoryStore
+
     try:
-        store = MemoryStore(StorageScope.LOCAL, store_dir)
-        store.initialize()
+        config = Config.load()
+        store = MemoryStore(
+            StorageScope.LOCAL, store_dir, vector_dtype=config.vector_dtype
+        )
+        store.initialize(config.vector_dimensions)
 
         console.print(f"[green]✓[/green] Created {store_dir.relative_to(current_dir)}")
         console.print("[green]✓[/green] Initialized local memory store")
@@ -1,6 +1,10 @@
-"""File chunking using Chonkie's SemanticChunker."""
+"""File chunking using Chonkie's SemanticChunker and TokenChunker."""
 
-from chonkie import SemanticChunker
+from collections.abc import Iterator
+from typing import Literal
+
+import numpy as np
+from chonkie import SemanticChunker, TokenChunker
 
 from ram.models.chunk import Chunk
 
@@ -9,22 +13,86 @@ class FileChunker:
     """Chunks text files using semantic boundaries.
 
     Uses Chonkie's SemanticChunker for intelligent content-aware splitting
-    that respects paragraph and sentence boundaries.
+    that respects paragraph and sentence boundaries. Large texts (or all
+    texts in "sliding" mode) use a fixed-stride token window instead, which
+    skips the semantic chunker's own embedding pass.
 
     Attributes:
         chunker: Chonkie SemanticChunker instance
+        mode: "semantic" or "sliding"
+        size_threshold_bytes: Text size above which sliding windows are used
+        min_semantic_chars: Texts this short become a single chunk
     """
 
-    def __init__(self, chunk_size: int = 512, chunk_overlap: int = 50):
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        chunk_overlap: int = 50,
+        segment_chars: int = 512_000,
+        mode: Literal["semantic", "sliding"] = "semantic",
+        size_threshold_bytes: int = 1_000_000,
+        tokenizer: str = "sentence-transformers/all-MiniLM-L6-v2",
+        min_semantic_chars: int = 2000,
+    ):
         """Initialize FileChunker.
 
         Args:
             chunk_size: Target size in tokens per chunk (default: 512)
             chunk_overlap: Overlap in tokens between chunks (default: 50)
+            segment_chars: Approximate characters chunked per batch by iter_chunk_arrays
+            mode: "semantic" picks sliding windows only above the size threshold;
+                "sliding" always uses them
+            size_threshold_bytes: Text size above which sliding windows are used
+            tokenizer: Tokenizer used for sliding windows
+            min_semantic_chars: Texts this short skip chunking and become a
+                single chunk (default: 2000)
         """
-        self.chunker = SemanticChunker(
-            chunk_size=chunk_size, chunk_overlap=chunk_overlap
-        )
+        self.segment_chars = segment_chars
+        self.mode = mode
+        self.size_threshold_bytes = size_threshold_bytes
+        self.chunk_size = chunk_size
+        self.tokenizer = tokenizer
+        self.min_semantic_chars = min_semantic_chars
+        self.chunk_overlap = chunk_overlap
+        self._semantic_chunker = None
+        self._sliding_chunker = None
+
+    @property
+    def chunker(self) -> SemanticChunker:
+        """Chonkie SemanticChunker, created on first use.
+
+        Creating it loads an embedding model, which tiny files never need.
+        """
+        if self._semantic_chunker is None:
+            self._semantic_chunker = SemanticChunker(
+                chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap
+            )
+        return self._semantic_chunker
+
+    def _select_chunker(self, text: str):
+        """Pick the Chonkie chunker for a text based on mode and size.
+
+        Character count stands in for byte size; it never exceeds the UTF-8
+        byte length, so the threshold is never crossed early.
+
+        Args:
+            text: Full text about to be chunked
+
+        Returns:
+            SemanticChunker or TokenChunker instance
+        """
+        if self.mode == "semantic" and len(text) <= self.size_threshold_bytes:
+            return self.chunker
+
+        if self._sliding_chunker is None:
+            # Windows of K tokens advancing by S = 0.75K tokens
+            stride = int(0.75 * self.chunk_size)
+            self._sliding_chunker = TokenChunker(
+                tokenizer=self.tokenizer,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_size - stride,
+            )
+        return self._sliding_chunker
 
     def chunk(self, text: str) -> list[Chunk]:
         """Chunk text into semantic segments.
@@ -35,8 +103,12 @@ class FileChunker:
         Returns:
             List of Chunk objects with text and position information
         """
+        # Tiny texts fit in one chunk; skip Chonkie entirely
+        if len(text) <= self.min_semantic_chars:
+            return [Chunk(text, 0, len(text), 0)] if text else []
+
         # Use Chonkie to split text
-        chonkie_chunks = self.chunker.chunk(text)
+        chonkie_chunks = self._select_chunker(text).chunk(text)
 
         # Convert to our Chunk model
         chunks = []
@@ -50,3 +122,91 @@ class FileChunker:
             chunks.append(chunk)
 
         return chunks
+
+    def chunk_arrays(self, text: str) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Chunk text into parallel arrays instead of Chunk objects.
+
+        Cheaper than chunk() on the indexing hot path, which only needs the
+        texts and positions.
+
+        Args:
+            text: Text content to chunk
+
+        Returns:
+            Tuple of (chunk texts, start indices, end indices)
+        """
+        if len(text) <= self.min_semantic_chars:
+            return self._single_chunk_arrays(text)
+
+        return self._to_arrays(self._select_chunker(text).chunk(text))
+
+    def iter_chunk_arrays(
+        self, text: str
+    ) -> Iterator[tuple[list[str], np.ndarray, np.ndarray]]:
+        """Chunk text segment by segment, yielding one batch per segment.
+
+        Text is split into segments of roughly segment_chars, cut at paragraph
+        breaks where possible, so callers can embed one batch while the next
+        is being chunked. Positions are relative to the whole text.
+
+        Args:
+            text: Text content to chunk
+
+        Yields:
+            Tuples of (chunk texts, start indices, end indices) in document order
+        """
+        if len(text) <= self.min_semantic_chars:
+            if text:
+                yield self._single_chunk_arrays(text)
+            return
+
+        chunker = self._select_chunker(text)
+        offset = 0
+        while offset < len(text):
+            end = offset + self.segment_chars
+            if end < len(text):
+                # Prefer to cut at a paragraph break inside the segment
+                brk = text.rfind("\n\n", offset, end)
+                if brk > offset:
+                    end = brk + 2
+
+            chonkie_chunks = chunker.chunk(text[offset:end])
+            if chonkie_chunks:
+                yield self._to_arrays(chonkie_chunks, offset)
+            offset = end
+
+    def _to_arrays(
+        self, chonkie_chunks: list, offset: int = 0
+    ) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Convert Chonkie chunks into parallel text, start and end arrays.
+
+        Args:
+            chonkie_chunks: Chunks returned by a Chonkie chunker
+            offset: Position of the chunked text within the whole text
+
+        Returns:
+            Tuple of (chunk texts, start indices, end indices)
+        """
+        texts = [chonkie_chunk.text for chonkie_chunk in chonkie_chunks]
+        starts = offset + np.fromiter(
+            (chonkie_chunk.start_index for chonkie_chunk in chonkie_chunks),
+            dtype=np.int64,
+            count=len(chonkie_chunks),
+        )
+        ends = starts + np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        return texts, starts, ends
+
+    def _single_chunk_arrays(
+        self, text: str
+    ) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Build chunk arrays holding the whole text as one chunk.
+
+        Args:
+            text: Text content
+
+        Returns:
+            Tuple of (chunk texts, start indices, end indices); empty for ""
+        """
+        if not text:
+            return [], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return [text], np.array([0], dtype=np.int64), np.array([len(text)], dtype=np.int64)
@@ -1,30 +1,70 @@
 """Embedding generation using sentence-transformers."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 from ram.models.chunk import Chunk
 
+# Loaded models keyed by model name, shared across EmbeddingGenerator instances
+_MODEL_CACHE: dict[str, SentenceTransformer] = {}
+
+# One encode thread per cached model. A single worker is enough: torch
+# releases the GIL inside its kernels, so the calling thread can keep
+# chunking while a batch is encoded, and async encodes of a shared model
+# never run concurrently.
+_ENCODE_POOLS: dict[str, ThreadPoolExecutor] = {}
+
+
+def _auto_device() -> str:
+    """Pick the fastest available torch device.
+
+    Returns:
+        "cuda", "mps", or "cpu"
+    """
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
 
 class EmbeddingGenerator:
     """Generates embeddings for text chunks using sentence-transformers.
 
     Uses the sentence-transformers/all-MiniLM-L6-v2 model which produces
-    384-dimensional embeddings suitable for semantic search.
+    384-dimensional embeddings suitable for semantic search. Models are
+    loaded once per process and reused by later instances.
 
     Attributes:
         model: SentenceTransformer model instance
         model_name: Name of the embedding model
+        batch_size: Number of texts encoded per forward pass
     """
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        batch_size: int | None = None,
+    ):
         """Initialize EmbeddingGenerator.
 
         Args:
             model_name: Name of sentence-transformers model to use
+            batch_size: Texts per forward pass. If None, uses 128 on GPU and 32 on CPU.
         """
         self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        device = _auto_device()
+        if model_name not in _MODEL_CACHE:
+            _MODEL_CACHE[model_name] = SentenceTransformer(model_name, device=device)
+            _ENCODE_POOLS[model_name] = ThreadPoolExecutor(max_workers=1)
+        self.model = _MODEL_CACHE[model_name]
+        if batch_size is None:
+            batch_size = 32 if device == "cpu" else 128
+        self.batch_size = batch_size
+        self._encode_pool = _ENCODE_POOLS[model_name]
 
     def generate(
         self, chunks: list[Chunk], show_progress: bool = False
@@ -38,10 +78,38 @@ class EmbeddingGenerator:
         Returns:
             Numpy array of shape (n_chunks, 384) with embeddings
         """
-        # Extract text from chunks
-        texts = [chunk.text for chunk in chunks]
+        return self.encode([chunk.text for chunk in chunks], show_progress)
+
+    def encode(self, texts: list[str], show_progress: bool = False) -> np.ndarray:
+        """Generate embeddings for a list of raw texts.
 
-        # Generate embeddings
-        embeddings = self.model.encode(texts, show_progress_bar=show_progress)
+        Args:
+            texts: Texts to embed
+            show_progress: Whether to show progress bar (for large batches)
 
-        return embeddings
+        Returns:
+            Numpy array of shape (n_texts, 384) with unit-length embeddings
+        """
+        # sentence-transformers already encodes in length-sorted batches and
+        # restores input order, so texts are passed through as-is
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            show_progress_bar=show_progress,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+    def encode_async(
+        self, texts: list[str], show_progress: bool = False
+    ) -> Future[np.ndarray]:
+        """Embed texts on the model's shared background encode thread.
+
+        Args:
+            texts: Texts to embed
+            show_progress: Whether to show progress bar (for large batches)
+
+        Returns:
+            Future resolving to the array encode() would return
+        """
+        return self._encode_pool.submit(self.encode, texts, show_progress)
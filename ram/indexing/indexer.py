@@ -1,12 +1,16 @@
 """File indexing orchestration."""
 
-import hashlib
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+import pyarrow as pa
+
 from ram.indexing.chunker import FileChunker
 from ram.indexing.embedder import EmbeddingGenerator
-from ram.models.chunk import Chunk
+from ram.indexing.reader import read_file
 
 
 class FileIndexer:
@@ -27,7 +31,7 @@ class FileIndexer:
 
     def process_file(
         self, file_path: Path, show_progress: bool = False
-    ) -> list[dict]:
+    ) -> pa.RecordBatch:
         """Process a file into index entries ready for storage.
 
         Args:
@@ -35,32 +39,104 @@ class FileIndexer:
             show_progress: Whether to show progress bars
 
         Returns:
-            List of index entry dicts ready for LanceDB storage
+            Record batch of index entries ready for LanceDB storage
         """
-        # Read file content
-        content = file_path.read_text(encoding="utf-8")
-
-        # Compute file hash for duplicate detection
-        file_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-
-        # Chunk the content
-        chunks = self.chunker.chunk(content)
-
-        # Generate embeddings
-        embeddings = self.embedder.generate(chunks, show_progress=show_progress)
-
-        # Create index entries
-        index_entries = []
-        for chunk, embedding in zip(chunks, embeddings):
-            entry = {
-                "text": chunk.text,
-                "vector": embedding.tolist(),
-                "file_path": str(file_path.absolute()),
-                "chunk_index": chunk.chunk_index,
-                "chunk_size": chunk.size,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "file_hash": file_hash,
-            }
-            index_entries.append(entry)
+        content, file_hash, _ = read_file(file_path)
+
+        return self.process_text(
+            file_path, content, file_hash, show_progress=show_progress
+        )
+
+    def process_files(
+        self, file_paths: list[Path], show_progress: bool = False
+    ) -> Iterator[pa.RecordBatch]:
+        """Process several files, yielding one record batch per file.
+
+        Files are processed largest first so the longest embedding jobs start
+        early and small files fill in at the end. The next file is processed
+        on a worker thread while the caller stores the current batch.
+
+        Args:
+            file_paths: Paths of the files to index
+            show_progress: Whether to show progress bars
+
+        Yields:
+            Record batch of index entries for each file, largest file first
+        """
+        paths = sorted(file_paths, key=lambda p: p.stat().st_size, reverse=True)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = None
+            for path in paths:
+                future = pool.submit(self.process_file, path, show_progress)
+                if pending is not None:
+                    yield pending.result()
+                pending = future
+            if pending is not None:
+                yield pending.result()
+
+    def process_text(
+        self,
+        file_path: Path,
+        content: str,
+        file_hash: str,
+        show_progress: bool = False,
+    ) -> pa.RecordBatch:
+        """Process already-read file content into index entries.
 
-        return index_entries
+        Use this when the caller has read and hashed the file itself, so the
+        file is not read or hashed a second time.
+
+        Args:
+            file_path: Path the content was read from
+            content: Decoded UTF-8 file content
+            file_hash: SHA256 hex digest of the raw file bytes
+            show_progress: Whether to show progress bars
+
+        Returns:
+            Record batch of index entries ready for LanceDB storage
+        """
+        # Chunk segment by segment, keeping each batch's embedding in flight
+        # on the embedder's encode thread while the next segment is chunked
+        texts = []
+        sizes = []
+        futures = []
+        for batch_texts, starts, ends in self.chunker.iter_chunk_arrays(content):
+            texts.extend(batch_texts)
+            sizes.append(ends - starts)
+            futures.append(self.embedder.encode_async(batch_texts, show_progress))
+        batch_embeddings = [future.result() for future in futures]
+
+        dim = self.embedder.model.get_sentence_embedding_dimension()
+        if batch_embeddings:
+            embeddings = np.concatenate(batch_embeddings)
+            chunk_sizes = np.concatenate(sizes)
+        else:
+            embeddings = np.empty((0, dim))
+            chunk_sizes = np.empty(0, dtype=np.int64)
+
+        # Store vectors as float16 to halve on-disk size and scan bandwidth
+        embeddings = embeddings.astype(np.float16)
+
+        # All chunks from one call share a single ingest timestamp
+        timestamp = (
+            datetime.now(timezone.utc)
+            .isoformat(timespec="seconds")
+            .replace("+00:00", "Z")
+        )
+
+        # Build one columnar batch so the whole file is a single LanceDB commit
+        n = len(texts)
+        return pa.RecordBatch.from_pydict(
+            {
+                "text": texts,
+                "vector": pa.FixedSizeListArray.from_arrays(
+                    pa.array(embeddings.reshape(-1)), dim
+                ),
+                "file_path": [str(file_path.absolute())] * n,
+                "chunk_index": np.arange(n, dtype=np.int64),
+                "chunk_size": chunk_sizes,
+                "timestamp": [timestamp] * n,
+                "file_hash": [file_hash] * n,
+            }
+        )
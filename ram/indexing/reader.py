@@ -0,0 +1,68 @@
+"""File reading for indexing."""
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+# Files at or above this size are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 512 * 1024
+
+
+def read_file(
+    file_path: Path,
+    known_hash: str | None = None,
+    known_stat: os.stat_result | None = None,
+) -> tuple[str, str, os.stat_result]:
+    """Read a UTF-8 file and hash its raw bytes in a single pass over the data.
+
+    Large files are memory-mapped so hashing and decoding work directly on
+    the mapped pages, skipping the intermediate bytes copy. The file is
+    stat'ed through the open descriptor, so the returned stat describes the
+    content that was read.
+
+    Line endings are normalized to LF as Path.read_text() does. Files that
+    contain CR are hashed after normalizing, so content and hash match what
+    earlier versions indexed.
+
+    Args:
+        file_path: Path to the file to read
+        known_hash: Hash recorded for the file by an earlier run
+        known_stat: Stat the known_hash was looked up with. If the opened
+            file's mtime and size still match it, known_hash is returned
+            and the content is not hashed again.
+
+    Returns:
+        Tuple of (decoded content, SHA256 hex digest, stat of the read file)
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    with file_path.open("rb") as f:
+        stat = os.fstat(f.fileno())
+        unchanged = (
+            known_hash is not None
+            and known_stat is not None
+            and stat.st_mtime_ns == known_stat.st_mtime_ns
+            and stat.st_size == known_stat.st_size
+        )
+
+        # Raw bytes equal the encoded text unless CRs need normalizing
+        file_hash = known_hash
+        if stat.st_size < MMAP_THRESHOLD_BYTES:
+            raw = f.read()
+            content = raw.decode("utf-8")
+            if not unchanged and "\r" not in content:
+                file_hash = hashlib.sha256(raw).hexdigest()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8")
+                if not unchanged and "\r" not in content:
+                    file_hash = hashlib.sha256(mm).hexdigest()
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        if not unchanged:
+            file_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    return content, file_hash, stat
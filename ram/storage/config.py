@@ -6,6 +6,10 @@ from pathlib import Path
 
 from ram.storage.scope import StorageScope
 
+# Parsed configs keyed by (path, mtime_ns); a changed file gets a new key.
+# mtime_ns is None when the file does not exist.
+_CONFIG_CACHE: dict[tuple[Path, int | None], "Config"] = {}
+
 
 @dataclass
 class Config:
@@ -14,6 +18,8 @@ class Config:
     Attributes:
         embedding_model: Model name for embeddings
         vector_dimensions: Dimension of embedding vectors
+        optimize_every: Commits between automatic table compactions
+        vector_dtype: Stored vector precision ("float16", "int8", or "float32")
         default_scope: Default scope when unspecified
         auto_init_local: Auto-create .ragged_memory/ on first store
         global_dir: Global storage directory
@@ -22,6 +28,8 @@ class Config:
 
     embedding_model: str
     vector_dimensions: int
+    optimize_every: int
+    vector_dtype: str
     default_scope: StorageScope
     auto_init_local: bool
     global_dir: Path
@@ -31,17 +39,33 @@ class Config:
     def load(cls, config_path: Path | None = None) -> "Config":
         """Load config from TOML file, use defaults if missing.
 
+        Results are cached per file modification time, so repeated loads in
+        one process skip re-reading and re-parsing an unchanged file.
+
         Args:
             config_path: Path to config.toml file. If None, uses ~/.ragged_memory/config.toml
 
         Returns:
             Config instance with values from file or defaults
         """
+        if config_path is None:
+            config_path = Path.home() / ".ragged_memory" / "config.toml"
+
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        key = (config_path, mtime_ns)
+        if key in _CONFIG_CACHE:
+            return _CONFIG_CACHE[key]
+
         # Default configuration values
         defaults = {
             "storage": {
                 "embedding_model": "sentence-transformers/all-MiniLM-L6-v2",
                 "vector_dimensions": 384,
+                "optimize_every": 100,
+                "vector_dtype": "float16",
             },
             "scope": {
                 "default_scope": "local",
@@ -54,10 +78,7 @@ class Config:
         }
 
         # Try to load from file, fall back to defaults
-        if config_path is None:
-            config_path = Path.home() / ".ragged_memory" / "config.toml"
-
-        if config_path.exists():
+        if mtime_ns is not None:
             with open(config_path, "rb") as f:
                 loaded = tomllib.load(f)
                 # Merge loaded config with defaults
@@ -66,14 +87,18 @@ class Config:
                         defaults[section].update(loaded[section])
 
         # Build Config from merged values
-        return cls(
+        config = cls(
             embedding_model=defaults["storage"]["embedding_model"],
             vector_dimensions=defaults["storage"]["vector_dimensions"],
+            optimize_every=defaults["storage"]["optimize_every"],
+            vector_dtype=defaults["storage"]["vector_dtype"],
             default_scope=StorageScope(defaults["scope"]["default_scope"]),
             auto_init_local=defaults["scope"]["auto_init_local"],
             global_dir=Path(defaults["paths"]["global_dir"]).expanduser(),
             local_dir=defaults["paths"]["local_dir"],
         )
+        _CONFIG_CACHE[key] = config
+        return config
 
     def get_global_dir(self) -> Path:
         """Get the global storage directory path.
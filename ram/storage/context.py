@@ -1,7 +1,11 @@
 """Project context detection for Ragged Memory."""
 
+import os
 from pathlib import Path
 
+# Markers that identify a project root directory
+PROJECT_MARKERS = (".ragged_memory", ".git")
+
 
 class ProjectContext:
     """Represents the current project directory and its associated local store.
@@ -27,8 +31,10 @@ class ProjectContext:
     def _detect_project_root(self, start_dir: Path) -> Path | None:
         """Search upward for .ragged_memory/ or .git/ to find project root.
 
-        This traverses upward from start_dir looking for markers that indicate
-        a project root. Returns the first directory containing either marker.
+        If RAM_PROJECT_ROOT is set (e.g. by a shell hook), still exists, and
+        contains start_dir, it is used without walking. Otherwise this
+        traverses upward from start_dir looking for markers that indicate a
+        project root, listing each directory once with os.scandir.
 
         Args:
             start_dir: Directory to start searching from
@@ -37,13 +43,21 @@ class ProjectContext:
             Path to project root if found, None otherwise
         """
         current = start_dir.absolute()
+
+        cached_root = os.environ.get("RAM_PROJECT_ROOT")
+        if cached_root:
+            root = Path(cached_root).absolute()
+            if current.is_relative_to(root) and root.is_dir():
+                return root
+
         while current != current.parent:
-            # Check for .ragged_memory/ marker (explicit project marker)
-            if (current / ".ragged_memory").exists():
-                return current
-            # Check for .git/ marker (git repository root)
-            if (current / ".git").exists():
-                return current
+            try:
+                with os.scandir(current) as entries:
+                    if any(entry.name in PROJECT_MARKERS for entry in entries):
+                        return current
+            except OSError:
+                # Unreadable directory: keep searching upward
+                pass
             # Move up one directory
             current = current.parent
         return None
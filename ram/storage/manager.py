@@ -1,11 +1,13 @@
 """Storage manager for coordinating local and global memory stores."""
 
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ram.storage.config import Config
 from ram.storage.context import ProjectContext
 from ram.storage.scope import StorageScope
-from ram.storage.store import MemoryStore
+
+if TYPE_CHECKING:
+    from ram.storage.store import MemoryStore
 
 
 class StorageManager:
@@ -26,7 +28,7 @@ class StorageManager:
         self.config = config if config is not None else Config.load()
         self.context = context if context is not None else ProjectContext()
 
-    def get_store(self, scope: StorageScope | None = None) -> MemoryStore:
+    def get_store(self, scope: StorageScope | None = None) -> "MemoryStore":
         """Get a memory store for the specified scope.
 
         Args:
@@ -38,6 +40,9 @@ class StorageManager:
         Raises:
             ValueError: If LOCAL scope requested but no project detected
         """
+        # Deferred so importing ram.storage does not load pyarrow and numpy
+        from ram.storage.store import MemoryStore
+
         if scope is None:
             scope = self.config.default_scope
 
@@ -50,22 +55,30 @@ class StorageManager:
         else:  # GLOBAL
             store_path = self.config.get_global_dir()
 
-        store = MemoryStore(scope, store_path)
+        store = MemoryStore(
+            scope,
+            store_path,
+            optimize_every=self.config.optimize_every,
+            vector_dtype=self.config.vector_dtype,
+        )
 
         # Auto-initialize global store if it doesn't exist
         if scope == StorageScope.GLOBAL and not store.exists():
             self._initialize_global_store(store)
+        else:
+            # Make sure the table exists, e.g. for stores made by older versions
+            store.initialize(self.config.vector_dimensions)
 
         return store
 
-    def _initialize_global_store(self, store: MemoryStore) -> None:
+    def _initialize_global_store(self, store: "MemoryStore") -> None:
         """Initialize global store with default configuration.
 
         Args:
             store: MemoryStore instance for global scope
         """
-        # Create global directory
-        store.initialize()
+        # Create global directory and table
+        store.initialize(self.config.vector_dimensions)
 
         # Create default config.toml if it doesn't exist
         config_path = store.get_path() / "config.toml"
@@ -73,6 +86,8 @@ class StorageManager:
             default_config = """[storage]
 embedding_model = "sentence-transformers/all-MiniLM-L6-v2"
 vector_dimensions = 384
+optimize_every = 100
+vector_dtype = "float16"
 
 [scope]
 default_scope = "local"
@@ -1,11 +1,124 @@
 """Memory store implementation using LanceDB."""
 
+import json
+import os
+import queue
+import threading
+from collections.abc import Iterable
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
-import lancedb
+import numpy as np
+import pyarrow as pa
 
 from ram.storage.scope import StorageScope
 
+# IVF_PQ needs enough rows to train its partitions and PQ codebooks
+MIN_INDEX_ROWS = 256
+
+
+# Rows are written clustered by file, giving tight min/max stats on file_hash
+_SORT_KEYS = [("file_hash", "ascending"), ("chunk_index", "ascending")]
+
+# lancedb module, imported on first connection (see _get_lancedb)
+_lancedb = None
+
+# LanceDB connections shared by all stores in the process, keyed by db_path
+_CONN_CACHE: dict[str, Any] = {}
+_CONN_LOCK = threading.Lock()
+
+# Non-vector columns of an index entry
+_METADATA_COLUMNS = (
+    "text",
+    "file_path",
+    "chunk_index",
+    "chunk_size",
+    "timestamp",
+    "file_hash",
+)
+
+# String columns are stored LZ4-compressed; vectors compress poorly
+_LZ4 = {"lance-encoding:compression": "lz4"}
+
+# Arrow value type of the vector column for each vector_dtype. float32 only
+# appears in tables created before vectors were stored as float16.
+_VECTOR_TYPES = {"float32": pa.float32(), "float16": pa.float16(), "int8": pa.int8()}
+
+
+def _schema(dim: int, vector_dtype: str = "float16") -> pa.Schema:
+    """Build the Arrow schema of the memories table.
+
+    Args:
+        dim: Embedding dimension
+        vector_dtype: "float16", "float32" (older tables), or "int8" for
+            quantized vectors with a scale column
+
+    Returns:
+        PyArrow schema for index entries
+    """
+    fields = [
+        pa.field("text", pa.string(), metadata=_LZ4),
+        pa.field(
+            "vector",
+            pa.list_(_VECTOR_TYPES[vector_dtype], dim),
+        ),
+        pa.field("file_path", pa.string(), metadata=_LZ4),
+        pa.field("chunk_index", pa.int64()),
+        pa.field("chunk_size", pa.int64()),
+        pa.field("timestamp", pa.string(), metadata=_LZ4),
+        pa.field("file_hash", pa.string(), metadata=_LZ4),
+    ]
+    if vector_dtype == "int8":
+        fields.append(pa.field("scale", pa.float32()))
+    return pa.schema(fields)
+
+
+def _get_lancedb():
+    """Import lancedb on first use.
+
+    lancedb pulls in its Rust extension and tantivy bindings, which commands
+    that never touch storage (--help, --version) should not pay for.
+
+    Returns:
+        The lancedb module
+    """
+    global _lancedb
+    if _lancedb is None:
+        import lancedb
+
+        _lancedb = lancedb
+    return _lancedb
+
+
+def _quote(value: str) -> str:
+    """Quote a string as a SQL literal for LanceDB filter expressions.
+
+    Args:
+        value: Raw string value
+
+    Returns:
+        Single-quoted literal with embedded quotes escaped
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _quantize(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quantize vectors to int8 with a symmetric per-vector scale.
+
+    Each vector is divided by max(|v|) / 127 and rounded, so v ≈ q * scale.
+
+    Args:
+        vectors: Array of shape (n, dim)
+
+    Returns:
+        Tuple of (int8 array of shape (n, dim), float32 scales of shape (n,))
+    """
+    scale = np.abs(vectors).max(axis=1).astype(np.float32) / 127
+    scale[scale == 0] = 1
+    quantized = np.round(vectors / scale[:, None]).astype(np.int8)
+    return quantized, scale
+
 
 class MemoryStore:
     """A persistent collection of memories with a specific scope and storage location.
@@ -14,29 +127,191 @@ class MemoryStore:
         scope: The scope of this store (LOCAL or GLOBAL)
         db_path: Path to the LanceDB database directory
         table_name: Name of the LanceDB table
+        meta_table_name: Name of the table caching file stat → hash
+        optimize_every: Commits between automatic table compactions
+        flush_threshold: Buffered rows that trigger a write to LanceDB
+        cleanup_older_than: Age after which compaction prunes old table versions
+        vector_dtype: "float16" (searchable), "int8" (quantized, with a scale
+            column), or "float32" when opened on a table created before float16
     """
 
-    def __init__(self, scope: StorageScope, db_path: Path):
+    def __init__(
+        self,
+        scope: StorageScope,
+        db_path: Path,
+        optimize_every: int = 100,
+        flush_threshold: int = 1000,
+        cleanup_older_than: timedelta = timedelta(days=1),
+        vector_dtype: str = "float16",
+    ):
         """Initialize a memory store.
 
         Args:
             scope: StorageScope (LOCAL or GLOBAL)
             db_path: Path where LanceDB files will be stored
+            optimize_every: Commits between automatic table compactions
+            flush_threshold: Buffered rows that trigger a write to LanceDB
+            cleanup_older_than: Age after which compaction prunes old table versions
+            vector_dtype: "float16" keeps vectors as produced by the indexer;
+                "int8" quantizes them on insert and adds a float32 scale column;
+                "float32" matches tables created before float16 storage
+
+        Raises:
+            ValueError: If vector_dtype is not a supported vector type
         """
+        if vector_dtype not in _VECTOR_TYPES:
+            raise ValueError(
+                f"Unsupported vector_dtype {vector_dtype!r}. "
+                f"Expected one of: {', '.join(_VECTOR_TYPES)}"
+            )
+
         self.scope = scope
         self.db_path = Path(db_path)
         self.table_name = "memories"
+        self.meta_table_name = "file_meta"
+        self.optimize_every = optimize_every
+        self._state_path = self.db_path / "state.json"
+        self.flush_threshold = flush_threshold
+        self.cleanup_older_than = cleanup_older_than
+        self.vector_dtype = vector_dtype
+        self._db = None
+        self._table = None
+        self._buffer: list[pa.Table] = []
+        self._buffered_rows = 0
+        # Hashes known to be indexed or staged; only touched from the caller's thread
+        self._hashes: set[str] = set()
+        self._dim: int | None = None
+        self._write_queue: queue.Queue[pa.Table | None] = queue.Queue(maxsize=8)
+        self._writer: threading.Thread | None = None
+        self._write_error: Exception | None = None
+
+    def initialize(self, dim: int) -> None:
+        """Create storage directory and the memories table.
 
-    def initialize(self) -> None:
-        """Create storage directory and initialize LanceDB connection.
+        A missing table is created empty with the typed schema, so inserts
+        never have to create it; the dimension and scope are kept in its
+        schema metadata. An existing table is opened as-is, whatever schema
+        it was created with. Missing indices are added either way.
+
+        Args:
+            dim: Embedding dimension of the stored vectors
 
-        This creates the directory structure but does not create tables.
-        Tables are created on first insert by LanceDB.
+        Raises:
+            ValueError: If an existing table stores a different vector type
         """
         self.db_path.mkdir(parents=True, exist_ok=True)
-        # Connect to verify database can be created
-        db = lancedb.connect(str(self.db_path))
-        # Table will be created on first insert
+        if self._table_exists(self.table_name):
+            table = self._open_table()
+            self._match_vector_dtype(table.schema)
+        else:
+            schema = _schema(dim, self.vector_dtype).with_metadata(
+                {"dim": str(dim), "scope": self.scope.value}
+            )
+            table = self._conn().create_table(
+                self.table_name,
+                schema=schema,
+                exist_ok=True,
+                storage_options={"new_table_data_storage_version": "2.1"},
+            )
+        self._ensure_indices(table)
+        self._table = table
+
+    def _match_vector_dtype(self, schema: pa.Schema) -> None:
+        """Check the configured vector_dtype against an existing table.
+
+        Tables created before float16 storage hold float32 vectors; a store
+        left at the float16 default keeps writing float32 to them.
+
+        Args:
+            schema: Schema of the existing memories table
+
+        Raises:
+            ValueError: If the table stores a different or unsupported vector type
+        """
+        vector_type = schema.field("vector").type
+        stored = None
+        if pa.types.is_fixed_size_list(vector_type):
+            stored = next(
+                (name for name, t in _VECTOR_TYPES.items() if t == vector_type.value_type),
+                None,
+            )
+        if stored is None:
+            raise ValueError(
+                f"Store at {self.db_path} has an unsupported vector column type "
+                f"{vector_type}. Re-create the store."
+            )
+        if stored == self.vector_dtype:
+            return
+        if stored == "float32" and self.vector_dtype == "float16":
+            self.vector_dtype = "float32"
+            return
+        raise ValueError(
+            f"Store at {self.db_path} holds {stored} vectors but vector_dtype is "
+            f"{self.vector_dtype!r}. Set vector_dtype = \"{stored}\" in config.toml "
+            "or re-create the store."
+        )
+
+    def close(self) -> None:
+        """Flush buffered chunks, wait for pending writes, and drop cached handles.
+
+        The next operation reconnects and reopens the table.
+
+        Raises:
+            Exception: The first error raised by a background write, if any
+        """
+        self.flush()
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._raise_write_error()
+
+        self._db = None
+        self._table = None
+        self._dim = None
+
+    def _conn(self):
+        """Get the LanceDB connection, connecting on first use.
+
+        Connections are shared process-wide, so several stores on the same
+        db_path connect only once.
+
+        Returns:
+            Cached LanceDB connection for db_path
+        """
+        if self._db is None:
+            key = str(self.db_path)
+            with _CONN_LOCK:
+                if key not in _CONN_CACHE:
+                    _CONN_CACHE[key] = _get_lancedb().connect(key)
+                self._db = _CONN_CACHE[key]
+        return self._db
+
+    def _table_exists(self, name: str) -> bool:
+        """Check whether a LanceDB table exists with a single stat.
+
+        Cheaper than letting open_table fail and raise for a missing table.
+
+        Args:
+            name: Table name
+
+        Returns:
+            True if the table's .lance directory exists, False otherwise
+        """
+        return (self.db_path / f"{name}.lance").exists()
+
+    def _open_table(self):
+        """Get the memories table, opening it on first use.
+
+        Returns:
+            Cached LanceDB table handle
+
+        Raises:
+            FileNotFoundError, ValueError: If initialize() has not created the table
+        """
+        if self._table is None:
+            self._table = self._conn().open_table(self.table_name)
+        return self._table
 
     def exists(self) -> bool:
         """Check if store directory exists.
@@ -54,42 +329,401 @@ class MemoryStore:
         """
         return self.db_path
 
-    def add_chunks(self, chunks: list[dict]) -> None:
-        """Add chunk entries to the memory store.
+    def add_chunks(self, chunks: pa.RecordBatch | list[dict]) -> None:
+        """Stage chunk entries for the memory store.
+
+        Compatibility wrapper that converts input to the typed schema once
+        and hands it to add_chunks_arrow().
+
+        Args:
+            chunks: Record batch (or list of dicts) of index entries with text,
+                vector, and metadata
+        """
+        self.add_chunks_arrow(self._to_table(chunks))
+
+    def add_chunks_arrow(self, chunks: pa.Table | pa.RecordBatch) -> None:
+        """Stage Arrow chunk entries for the memory store.
+
+        Entries are buffered in memory and written in one commit once
+        flush_threshold rows are staged, or when flush() or close() is
+        called. Callers must close() the store before exiting. Input already
+        in the store's schema, such as FileIndexer output, is staged without
+        any conversion.
+
+        Args:
+            chunks: Table or record batch of index entries with text, vector,
+                and metadata
+
+        Raises:
+            ValueError: If the vector dimension differs from the stored table's
+        """
+        if isinstance(chunks, pa.RecordBatch):
+            chunks = pa.Table.from_batches([chunks])
+
+        dim = chunks.schema.field("vector").type.list_size
+        schema = _schema(dim, self.vector_dtype)
+        if chunks.schema.equals(schema):
+            self._check_dim(dim)
+        else:
+            chunks = self._to_table(chunks)
+
+        self._buffer.append(chunks)
+        self._buffered_rows += chunks.num_rows
+        self._hashes.update(chunks.column("file_hash").unique().to_pylist())
+
+        if self._buffered_rows >= self.flush_threshold:
+            self.flush()
+
+    def _to_table(self, chunks: pa.Table | pa.RecordBatch | list[dict]) -> pa.Table:
+        """Convert index entries into a table with the store's typed schema.
+
+        Vectors are converted as one contiguous numpy array rather than
+        element by element, then cast to the store's vector type or quantized
+        to int8.
+
+        Args:
+            chunks: Table, record batch, or list of dicts of index entries
+
+        Returns:
+            Table matching _schema(dim, vector_dtype)
+
+        Raises:
+            ValueError: If the vector dimension differs from the stored table's
+        """
+        if isinstance(chunks, (pa.RecordBatch, pa.Table)):
+            dim = chunks.schema.field("vector").type.list_size
+            vector_column = chunks.column("vector")
+            if isinstance(vector_column, pa.ChunkedArray):
+                vector_column = vector_column.combine_chunks()
+            vectors = vector_column.flatten().to_numpy(zero_copy_only=False)
+            vectors = vectors.reshape(-1, dim)
+            columns = {name: chunks.column(name) for name in _METADATA_COLUMNS}
+        else:
+            vectors = np.asarray([entry["vector"] for entry in chunks])
+            dim = vectors.shape[1]
+            columns = {
+                name: [entry[name] for entry in chunks] for name in _METADATA_COLUMNS
+            }
+
+        self._check_dim(dim)
+
+        if self.vector_dtype == "int8":
+            vectors, columns["scale"] = _quantize(vectors)
+        else:
+            vectors = vectors.astype(
+                _VECTOR_TYPES[self.vector_dtype].to_pandas_dtype(), copy=False
+            )
+        columns["vector"] = pa.FixedSizeListArray.from_arrays(
+            pa.array(vectors.reshape(-1)), dim
+        )
+
+        return pa.Table.from_pydict(columns, schema=_schema(dim, self.vector_dtype))
+
+    def _check_dim(self, dim: int) -> None:
+        """Reject entries whose vector dimension differs from the table's.
+
+        One check up front instead of a failed commit on the writer thread.
+
+        Args:
+            dim: Vector dimension of incoming entries
+
+        Raises:
+            ValueError: If dim does not match the stored table's dimension
+        """
+        if dim != self._table_dim():
+            raise ValueError(
+                f"Vector dimension {dim} does not match store dimension {self._table_dim()}"
+            )
+
+    def _table_dim(self) -> int:
+        """Get the vector dimension of the memories table, read once.
+
+        Tables created before the dimension was stored in the schema metadata
+        fall back to the vector column's list size.
+
+        Returns:
+            Embedding dimension of stored vectors
+        """
+        if self._dim is None:
+            schema = self._open_table().schema
+            metadata = schema.metadata or {}
+            if b"dim" in metadata:
+                self._dim = int(metadata[b"dim"])
+            else:
+                self._dim = schema.field("vector").type.list_size
+        return self._dim
+
+    def flush(self) -> None:
+        """Hand all buffered chunk entries to the writer thread as one commit.
+
+        Returns once the batch is queued; the write itself happens in the
+        background. Blocks if several commits are already queued. Call
+        close() to wait for writes to finish.
+        """
+        self._raise_write_error()
+        if not self._buffer:
+            return
+
+        chunks = pa.concat_tables(self._buffer).sort_by(_SORT_KEYS)
+        self._buffer = []
+        self._buffered_rows = 0
+
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+        self._write_queue.put(chunks)
+
+    def _write_loop(self) -> None:
+        """Write queued tables to LanceDB until a None sentinel arrives."""
+        while True:
+            chunks = self._write_queue.get()
+            try:
+                if chunks is None:
+                    return
+                table = self._open_table()
+                table.add(chunks)
+                self._record_commit(table)
+            except Exception as e:
+                if self._write_error is None:
+                    self._write_error = e
+            finally:
+                self._write_queue.task_done()
+
+    def _raise_write_error(self) -> None:
+        """Re-raise the first background write error on the caller's thread."""
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def upsert_chunks(self, chunks: pa.RecordBatch | list[dict]) -> None:
+        """Insert only entries whose (file_hash, chunk_index) is not yet stored.
+
+        Uses a single merge_insert pass, so ingest paths that do not need to
+        ask the user about duplicates can skip check_file_exists entirely.
+        Staged and queued writes are committed first so they are matched too.
+
+        Args:
+            chunks: Record batch (or list of dicts) of index entries with text,
+                vector, and metadata
+        """
+        chunks = self._to_table(chunks)
+
+        self.flush()
+        self._write_queue.join()
+        self._raise_write_error()
+
+        table = self._open_table()
+        (
+            table.merge_insert(["file_hash", "chunk_index"])
+            .when_not_matched_insert_all()
+            .execute(chunks)
+        )
+        self._record_commit(table)
+
+        self._hashes.update(chunks.column("file_hash").unique().to_pylist())
+
+    def bulk_load(self, entries: pa.Table) -> None:
+        """Append a large table of entries straight to the Lance dataset.
+
+        Meant for initial bulk indexing: it bypasses LanceDB's table.add
+        wrapper and the staging buffer, writes with lance.write_dataset in
+        large files, and compacts once at the end instead of counting commits.
+
+        Args:
+            entries: Table of index entries with text, vector, and metadata
+        """
+        import lance
+
+        entries = self._to_table(entries).sort_by(_SORT_KEYS)
+
+        # Commit staged and queued writes first so ordering is preserved
+        self.flush()
+        self._write_queue.join()
+        self._raise_write_error()
+
+        lance.write_dataset(
+            entries,
+            str(self.db_path / f"{self.table_name}.lance"),
+            mode="append",
+            max_rows_per_file=1_000_000,
+        )
+
+        # Reopen so the handle sees the new version, then compact once
+        self._table = None
+        table = self._open_table()
+        table.optimize(cleanup_older_than=self.cleanup_older_than)
+        self._ensure_indices(table)
+
+        self._hashes.update(entries.column("file_hash").unique().to_pylist())
+
+    def add_batches(self, batches: Iterable[pa.RecordBatch]) -> None:
+        """Add a stream of record batches through the staging buffer.
+
+        Batches are consumed lazily, so a producer such as
+        FileIndexer.process_files can prepare the next batch while the
+        current one is written. Callers must close() afterwards.
+
+        Args:
+            batches: Record batches of index entries, typically one per file
+        """
+        for batch in batches:
+            self.add_chunks_arrow(batch)
+
+    def _record_commit(self, table) -> None:
+        """Count a commit and compact the table every optimize_every commits.
+
+        Compaction merges small fragments and prunes table versions older than
+        cleanup_older_than, bounding both fragment count and disk use. The
+        counter is persisted in state.json so it survives across CLI runs.
+        Compaction also builds any missing indices; later compactions keep
+        them up to date. The file_meta table, which gets one merge_insert
+        commit per indexed file, is compacted on the same schedule.
+
+        Args:
+            table: LanceDB table that was just written to
+        """
+        state = {}
+        if self._state_path.exists():
+            state = json.loads(self._state_path.read_text())
+
+        pending_commits = state.get("pending_commits", 0) + 1
+        if pending_commits >= self.optimize_every:
+            table.optimize(cleanup_older_than=self.cleanup_older_than)
+            self._ensure_indices(table)
+            if self._table_exists(self.meta_table_name):
+                meta = self._conn().open_table(self.meta_table_name)
+                meta.optimize(cleanup_older_than=self.cleanup_older_than)
+            pending_commits = 0
+
+        state["pending_commits"] = pending_commits
+        self._state_path.write_text(json.dumps(state))
+
+    def _ensure_indices(self, table) -> None:
+        """Create the file_hash and vector indices if they are missing.
+
+        Called when the table is initialized and after each compaction. The
+        vector index waits until the table has enough rows to train it, and
+        is skipped for int8 vectors, which LanceDB cannot ANN-index.
+
+        Args:
+            table: LanceDB table to index
+        """
+        indexed = {column for index in table.list_indices() for column in index.columns}
+        if "file_hash" not in indexed:
+            table.create_scalar_index("file_hash", index_type="BTREE")
+        if self.vector_dtype == "int8" or "vector" in indexed:
+            return
+        if table.count_rows() >= MIN_INDEX_ROWS:
+            self._create_index(table)
+
+    def _create_index(self, table) -> None:
+        """Build the ANN index on the vector column using dot-product distance.
+
+        Embeddings are unit-normalized, so dot product ranks results the same
+        as cosine similarity without computing vector norms per query. Query
+        vectors must be normalized the same way.
+
+        Args:
+            table: LanceDB table to index
+        """
+        table.create_index(metric="dot", vector_column_name="vector")
+
+    def fast_check(self, file_path: Path, stat: os.stat_result) -> str | None:
+        """Look up the recorded hash of a file that has not changed since.
+
+        A file counts as unchanged when its mtime and size match the values
+        recorded by record_file().
+
+        Args:
+            file_path: Path to the file
+            stat: Current stat of the file
+
+        Returns:
+            Recorded SHA256 hash, or None if unknown or changed
+        """
+        if not self._table_exists(self.meta_table_name):
+            return None
+        meta = self._conn().open_table(self.meta_table_name)
+
+        path = str(file_path.absolute())
+        rows = (
+            meta.search()
+            .where(f"path = {_quote(path)}")
+            .select(["mtime_ns", "size", "file_hash"])
+            .limit(1)
+            .to_list()
+        )
+        if not rows:
+            return None
+
+        row = rows[0]
+        if row["mtime_ns"] != stat.st_mtime_ns or row["size"] != stat.st_size:
+            return None
+        return row["file_hash"]
+
+    def record_file(
+        self, file_path: Path, file_hash: str, stat: os.stat_result
+    ) -> None:
+        """Record a file's mtime, size and hash for later fast_check() calls.
 
         Args:
-            chunks: List of index entry dicts with text, vector, and metadata
+            file_path: Path to the indexed file
+            file_hash: SHA256 hash of the file content
+            stat: Stat taken when the content was read, so edits made while
+                indexing are not recorded against the old hash
         """
-        db = lancedb.connect(str(self.db_path))
+        data = [
+            {
+                "path": str(file_path.absolute()),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "file_hash": file_hash,
+            }
+        ]
 
-        # Check if table exists
-        try:
-            table = db.open_table(self.table_name)
-            # Append to existing table
-            table.add(chunks)
-        except (FileNotFoundError, ValueError):
-            # Create new table
-            db.create_table(self.table_name, data=chunks)
+        db = self._conn()
+        if not self._table_exists(self.meta_table_name):
+            meta = db.create_table(self.meta_table_name, data=data)
+            meta.create_scalar_index("path", index_type="BTREE")
+            return
+
+        meta = db.open_table(self.meta_table_name)
+        (
+            meta.merge_insert("path")
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(data)
+        )
 
     def check_file_exists(self, file_hash: str) -> bool:
         """Check if a file with given hash is already indexed.
 
+        Meant for interactive flows that ask before re-indexing; other ingest
+        paths should use upsert_chunks instead of checking first. Staged
+        hashes and earlier hits are answered from an in-process set; anything
+        else is a single filtered lookup served by the file_hash BTREE index.
+
         Args:
             file_hash: SHA256 hash of file content
 
         Returns:
-            True if file is already indexed, False otherwise
+            True if file is already indexed or staged, False otherwise
         """
-        try:
-            db = lancedb.connect(str(self.db_path))
-            table = db.open_table(self.table_name)
-
-            # Query for entries with this file hash
-            df = table.to_pandas()
-            if df.empty:
-                return False
-
-            return (df["file_hash"] == file_hash).any()
-        except (FileNotFoundError, ValueError):
-            # Table doesn't exist yet or other error
+        if file_hash in self._hashes:
+            return True
+        if not self._table_exists(self.table_name):
             return False
+
+        # Let queued writes land so the lookup sees every flushed batch
+        self._write_queue.join()
+        rows = (
+            self._open_table()
+            .search()
+            .where(f"file_hash = {_quote(file_hash)}")
+            .select(["file_hash"])
+            .limit(1)
+            .to_list()
+        )
+        if rows:
+            self._hashes.add(file_hash)
+        return bool(rows)